@@ -65,6 +65,10 @@ def pytest_addoption(parser: tp.Any) -> None:
 
 
 def pytest_configure(config: tp.Any) -> None:
+    # Export the commit, so pytest-xdist workers (spawned later with a copy of the environment)
+    # don't need to run `git` again
+    os.environ["GIT_REVISION"] = helpers.get_current_commit()
+
     # don't bother collecting metadata if all tests are skipped
     if config.getvalue("skipall"):
         return
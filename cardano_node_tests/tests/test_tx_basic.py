@@ -1,7 +1,6 @@
 """Tests for basic transactions."""
 
 import dataclasses
-import itertools
 import logging
 import re
 import typing as tp
@@ -1234,9 +1233,8 @@ class TestMultiInOut:
         )
 
         # Create TX data
-        _txins = [cluster_obj.g_query.get_utxo(address=r.address) for r in from_addr_recs]
-        # Flatten the list of lists that is _txins
-        txins = list(itertools.chain.from_iterable(_txins))
+        # Query UTxOs of all the "from" addresses at once
+        txins = cluster_obj.g_query.get_utxo(address=[r.address for r in from_addr_recs])
         txouts = [clusterlib.TxOut(address=addr, amount=amount) for addr in dst_addresses]
         tx_files = clusterlib.TxFiles(signing_key_files=[r.skey_file for r in from_addr_recs])
 
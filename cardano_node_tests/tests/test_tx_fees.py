@@ -1,6 +1,5 @@
 """Tests for fees of various kinds of transactions."""
 
-import itertools
 import logging
 import typing as tp
 
@@ -301,9 +300,8 @@ class TestExpectedFees:
         ]
 
         # create TX data
-        _txins = [cluster_obj.g_query.get_utxo(address=r.address) for r in from_addr_recs]
-        # flatten the list of lists that is _txins
-        txins = list(itertools.chain.from_iterable(_txins))
+        # query UTxOs of all the "from" addresses at once
+        txins = cluster_obj.g_query.get_utxo(address=[r.address for r in from_addr_recs])
         txouts = [clusterlib.TxOut(address=addr, amount=amount) for addr in dst_addresses]
         tx_files = clusterlib.TxFiles(signing_key_files=[r.skey_file for r in from_addr_recs])
 
@@ -1,20 +1,37 @@
 """Common functionality for Conway governance tests."""
 
+import atexit
+import concurrent.futures
 import dataclasses
-import json
+import enum
+import functools
 import logging
+import pathlib as pl
 import typing as tp
 
+import cbor2
 from cardano_clusterlib import clusterlib
 
 from cardano_node_tests.cluster_management import cluster_management
 from cardano_node_tests.tests import common
 from cardano_node_tests.utils import clusterlib_utils
+from cardano_node_tests.utils import configuration
 from cardano_node_tests.utils import governance_setup
 from cardano_node_tests.utils import governance_utils
+from cardano_node_tests.utils import helpers
 
 LOGGER = logging.getLogger(__name__)
 
+MAX_CLI_THREADS = 32
+
+_EMPTY_COMMITTEE: tp.Dict[str, tp.Any] = {}
+
+# Single worker thread keeps the writes in order
+_SAVE_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="conway_save_state"
+)
+atexit.register(_SAVE_EXECUTOR.shutdown, wait=True)
+
 
 @dataclasses.dataclass(frozen=True)
 class PParamPropRec:
@@ -25,13 +42,26 @@ class PParamPropRec:
     future_pparams: tp.Dict[str, tp.Any]
 
 
+class VoterRoles(enum.Enum):
+    CC = "cc"
+    DREP = "drep"
+    SPO = "spo"
+
+
+@dataclasses.dataclass(frozen=True)
+class VoterSpec:
+    role: VoterRoles
+    vkey_file: clusterlib.FileType
+    vote: clusterlib.Votes
+    idx: int
+
+
 def is_in_bootstrap(
     cluster_obj: clusterlib.ClusterLib,
 ) -> bool:
     """Check if the cluster is in bootstrap period."""
-    pv = cluster_obj.g_conway_governance.query.gov_state()["currentPParams"]["protocolVersion"][
-        "major"
-    ]
+    # Protocol parameters are much smaller than the whole governance state
+    pv = cluster_obj.g_query.get_protocol_params()["protocolVersion"]["major"]
     return bool(pv == 9)
 
 
@@ -40,8 +70,13 @@ def get_committee_val(data: tp.Dict[str, tp.Any]) -> tp.Dict[str, tp.Any]:
 
     The key can be either correctly "committee", or with typo "commitee".
     TODO: Remove this function when the typo is fixed in the ledger.
+
+    When there's no committee, the shared `_EMPTY_COMMITTEE` is returned, it must not be modified.
     """
-    return data.get("committee") or data.get("commitee") or {}
+    committee_val = data.get("committee")
+    if committee_val is None:
+        committee_val = data.get("commitee")
+    return _EMPTY_COMMITTEE if committee_val is None else committee_val
 
 
 def possible_rem_issue(gov_state: tp.Dict[str, tp.Any], epoch: int) -> bool:
@@ -60,23 +95,16 @@ def possible_rem_issue(gov_state: tp.Dict[str, tp.Any], epoch: int) -> bool:
     if len(removed_actions) != 1 or len(proposals) == 1:
         return False
 
-    action_txid = removed_actions[0]["txId"]
-    action_ix = removed_actions[0]["govActionIx"]
+    removed_id = (removed_actions[0]["txId"], removed_actions[0]["govActionIx"])
 
-    for _p in proposals:
-        _p_action_id = _p["actionId"]
-        if (
-            _p["expiresAfter"] < epoch
-            and _p_action_id["txId"] == action_txid
-            and _p_action_id["govActionIx"] == action_ix
-        ):
-            return True
-
-    return False
+    return any(
+        _p["expiresAfter"] < epoch
+        and (_p["actionId"]["txId"], _p["actionId"]["govActionIx"]) == removed_id
+        for _p in proposals
+    )
 
 
-def get_yes_abstain_vote(idx: int) -> clusterlib.Votes:
-    """Check that votes of DReps who abstained are not considered as "No" votes."""
+def _compute_yes_abstain_vote(idx: int) -> clusterlib.Votes:
     if idx == 1 or idx % 2 == 0:
         return clusterlib.Votes.YES
     if idx % 3 == 0:
@@ -84,8 +112,7 @@ def get_yes_abstain_vote(idx: int) -> clusterlib.Votes:
     return clusterlib.Votes.ABSTAIN
 
 
-def get_no_abstain_vote(idx: int) -> clusterlib.Votes:
-    """Check that votes of DReps who abstained are not considered as "No" votes."""
+def _compute_no_abstain_vote(idx: int) -> clusterlib.Votes:
     if idx == 1 or idx % 2 == 0:
         return clusterlib.Votes.NO
     if idx % 3 == 0:
@@ -93,22 +120,79 @@ def get_no_abstain_vote(idx: int) -> clusterlib.Votes:
     return clusterlib.Votes.ABSTAIN
 
 
+# Precomputed votes, indexed by voter index (starting from 1)
+MAX_LUT_VOTERS = 4096
+_YES_ABSTAIN_VOTES = tuple(_compute_yes_abstain_vote(i) for i in range(MAX_LUT_VOTERS))
+_NO_ABSTAIN_VOTES = tuple(_compute_no_abstain_vote(i) for i in range(MAX_LUT_VOTERS))
+
+
+def get_yes_abstain_vote(idx: int) -> clusterlib.Votes:
+    """Check that votes of DReps who abstained are not considered as "No" votes."""
+    if idx < MAX_LUT_VOTERS:
+        return _YES_ABSTAIN_VOTES[idx]
+    return _compute_yes_abstain_vote(idx)
+
+
+def get_no_abstain_vote(idx: int) -> clusterlib.Votes:
+    """Check that votes of DReps who abstained are not considered as "No" votes."""
+    if idx < MAX_LUT_VOTERS:
+        return _NO_ABSTAIN_VOTES[idx]
+    return _compute_no_abstain_vote(idx)
+
+
+def get_vote_getter(approve: bool) -> tp.Callable[[int], clusterlib.Votes]:
+    """Get a function returning "Yes" or "No" votes with some abstain votes for voter index."""
+    return get_yes_abstain_vote if approve else get_no_abstain_vote
+
+
+def _save_cbor(content: tp.Any, out_file: clusterlib.FileType) -> None:
+    """Save content to a CBOR file."""
+    with open(out_file, "wb") as out_fp:
+        cbor2.dump(content, out_fp)
+
+
+def _log_save_error(future: concurrent.futures.Future) -> None:
+    exc = future.exception()
+    if exc:
+        LOGGER.error("Failed to save state to a file: %s", exc)
+
+
+def _save_state_in_background(content: tp.Any, out_file_stem: str) -> None:
+    """Save content to a file in a background thread.
+
+    The file format (and extension) is selected by `configuration.STATE_DUMP_FORMAT`.
+
+    The saved states are meant only for debugging, so the test doesn't need to wait for the
+    file to be written. The content must not be modified afterwards.
+    """
+    save_func: tp.Callable[..., tp.Any]
+    if configuration.STATE_DUMP_FORMAT == "cbor":
+        save_func, out_file = _save_cbor, f"{out_file_stem}.cbor"
+    else:
+        save_func = functools.partial(helpers.write_json, indent=2)
+        out_file = f"{out_file_stem}.json"
+
+    # CWD can change before the file is written
+    out_path = pl.Path(out_file).absolute()
+    future = _SAVE_EXECUTOR.submit(save_func, content=content, out_file=out_path)
+    future.add_done_callback(_log_save_error)
+
+
 def save_gov_state(gov_state: tp.Dict[str, tp.Any], name_template: str) -> None:
     """Save governance state to a file."""
-    with open(f"{name_template}_gov_state.json", "w", encoding="utf-8") as out_fp:
-        json.dump(gov_state, out_fp, indent=2)
+    _save_state_in_background(content=gov_state, out_file_stem=f"{name_template}_gov_state")
 
 
 def save_committee_state(committee_state: tp.Dict[str, tp.Any], name_template: str) -> None:
     """Save CC state to a file."""
-    with open(f"{name_template}_committee_state.json", "w", encoding="utf-8") as out_fp:
-        json.dump(committee_state, out_fp, indent=2)
+    _save_state_in_background(
+        content=committee_state, out_file_stem=f"{name_template}_committee_state"
+    )
 
 
 def save_drep_state(drep_state: governance_utils.DRepStateT, name_template: str) -> None:
     """Save DRep state to a file."""
-    with open(f"{name_template}_drep_state.json", "w", encoding="utf-8") as out_fp:
-        json.dump(drep_state, out_fp, indent=2)
+    _save_state_in_background(content=drep_state, out_file_stem=f"{name_template}_drep_state")
 
 
 # TODO: move this and reuse in other tests that need a registered stake address.
@@ -140,30 +224,34 @@ def get_registered_pool_user(
     else:
         pool_users = _create_user()
 
-    # Fund the payment address with some ADA
-    for pool_user in pool_users:
-        clusterlib_utils.fund_from_faucet(
-            pool_user.payment,
-            cluster_obj=cluster_obj,
-            faucet_data=cluster_manager.cache.addrs_data["user1"],
-            amount=fund_amount,
-        )
+    # Fund the payment addresses with some ADA, all in a single Tx
+    clusterlib_utils.fund_from_faucet(
+        *pool_users,
+        cluster_obj=cluster_obj,
+        faucet_data=cluster_manager.cache.addrs_data["user1"],
+        amount=fund_amount,
+    )
 
     # Register the stake address
     stake_deposit_amt = cluster_obj.g_query.get_address_deposit()
-    stake_addr_reg_cert = [
-        cluster_obj.g_stake_address.gen_stake_addr_registration_cert(
-            addr_name=f"{name_template}_pool_user{i}",
-            deposit_amt=stake_deposit_amt,
-            stake_vkey_file=pool_users[i].stake.vkey_file,
+    stake_addr_reg_certs: tp.List[pl.Path] = []
+    payment_skeys: tp.List[pl.Path] = []
+    stake_skeys: tp.List[pl.Path] = []
+    # Collect everything that is needed for the Tx in a single pass over the pool users
+    for i, pool_user in enumerate(pool_users):
+        stake_addr_reg_certs.append(
+            cluster_obj.g_stake_address.gen_stake_addr_registration_cert(
+                addr_name=f"{name_template}_pool_user{i}",
+                deposit_amt=stake_deposit_amt,
+                stake_vkey_file=pool_user.stake.vkey_file,
+            )
         )
-        for i in range(no_of_users)
-    ]
-    pool_users_payment_skey = [pool_user.payment.skey_file for pool_user in pool_users]
-    pool_users_stake_skey = [pool_user.stake.skey_file for pool_user in pool_users]
+        payment_skeys.append(pool_user.payment.skey_file)
+        stake_skeys.append(pool_user.stake.skey_file)
+
     tx_files_action = clusterlib.TxFiles(
-        certificate_files= stake_addr_reg_cert,
-        signing_key_files=pool_users_payment_skey + pool_users_stake_skey,
+        certificate_files=stake_addr_reg_certs,
+        signing_key_files=[*payment_skeys, *stake_skeys],
     )
     clusterlib_utils.build_and_submit_tx(
         cluster_obj=cluster_obj,
@@ -180,6 +268,92 @@ def get_registered_pool_user(
     return pool_users
 
 
+def get_skipped_voters(no_of_voters: int) -> tp.Set[int]:
+    """Get indexes (starting from 1) of voters that don't vote."""
+    return set(range(3, no_of_voters + 1, 3))
+
+
+def _map_in_threads(func: tp.Callable, *iterables: tp.Iterable) -> list:
+    """Run independent (IO bound) `cardano-cli` calls in parallel threads.
+
+    The GIL is released while waiting for the subprocesses, so threads are sufficient.
+
+    Note that `ClusterLib.cli` records CLI coverage without any locking, so concurrent calls
+    can occasionally lose updates of `cluster_obj.cli_coverage`. This is accepted, the batched
+    calls run the same command over and over, so at worst the reported counts are slightly lower.
+    """
+    args = [list(i) for i in iterables]
+    no_of_calls = min(len(a) for a in args) if args else 0
+
+    if no_of_calls <= 1:
+        return list(map(func, *args))
+
+    max_workers = min(MAX_CLI_THREADS, no_of_calls)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(func, *args))
+
+
+def create_votes_batch(
+    cluster_obj: clusterlib.ClusterLib,
+    name_template: str,
+    action_txid: str,
+    action_ix: int,
+    voter_specs: tp.List[VoterSpec],
+) -> tp.List[governance_utils.VotesAllT]:
+    """Create votes for all the voters at once.
+
+    The votes are created in parallel, the order of the returned votes matches the order
+    of `voter_specs`.
+    """
+    # Resolve the attributes once, not for every vote
+    create_committee = cluster_obj.g_conway_governance.vote.create_committee
+    create_drep = cluster_obj.g_conway_governance.vote.create_drep
+    create_spo = cluster_obj.g_conway_governance.vote.create_spo
+
+    anchor_data_hash = "5d372dca1a4cc90d7d16d966c48270e33e3aa0abcb0e78f0d5ca7ff330d2245d"
+    cc_name_prefix = f"{name_template}_cc"
+    drep_name_prefix = f"{name_template}_drep"
+    spo_name_prefix = f"{name_template}_pool"
+
+    def _create_vote(spec: VoterSpec) -> governance_utils.VotesAllT:
+        i = str(spec.idx)
+
+        if spec.role == VoterRoles.CC:
+            return create_committee(
+                vote_name=cc_name_prefix + i,
+                action_txid=action_txid,
+                action_ix=action_ix,
+                vote=spec.vote,
+                cc_hot_vkey_file=spec.vkey_file,
+                anchor_url=f"http://www.cc-vote{i}.com",
+                anchor_data_hash=anchor_data_hash,
+            )
+        if spec.role == VoterRoles.DREP:
+            return create_drep(
+                vote_name=drep_name_prefix + i,
+                action_txid=action_txid,
+                action_ix=action_ix,
+                vote=spec.vote,
+                drep_vkey_file=spec.vkey_file,
+                anchor_url=f"http://www.drep-vote{i}.com",
+                anchor_data_hash=anchor_data_hash,
+            )
+        if spec.role == VoterRoles.SPO:
+            return create_spo(
+                vote_name=spo_name_prefix + i,
+                action_txid=action_txid,
+                action_ix=action_ix,
+                vote=spec.vote,
+                cold_vkey_file=spec.vkey_file,
+                anchor_url=f"http://www.spo-vote{i}.com",
+                anchor_data_hash=anchor_data_hash,
+            )
+        msg = f"Unknown voter role `{spec.role}`"
+        raise ValueError(msg)
+
+    return _map_in_threads(_create_vote, voter_specs)
+
+
 def submit_vote(
     cluster_obj: clusterlib.ClusterLib,
     name_template: str,
@@ -232,62 +406,62 @@ def cast_vote(
 ) -> governance_utils.VotedVotes:
     """Cast a vote."""
     # pylint: disable=too-many-arguments
-    votes_cc = []
-    votes_drep = []
-    votes_spo = []
+    voter_specs: tp.List[VoterSpec] = []
 
     if approve_cc is not None:
-        _votes_cc = [
-            None  # This CC member doesn't vote, his votes count as "No"
-            if cc_skip_votes and i % 3 == 0
-            else cluster_obj.g_conway_governance.vote.create_committee(
-                vote_name=f"{name_template}_cc{i}",
-                action_txid=action_txid,
-                action_ix=action_ix,
-                vote=get_yes_abstain_vote(i) if approve_cc else get_no_abstain_vote(i),
-                cc_hot_vkey_file=m.hot_vkey_file,
-                anchor_url=f"http://www.cc-vote{i}.com",
-                anchor_data_hash="5d372dca1a4cc90d7d16d966c48270e33e3aa0abcb0e78f0d5ca7ff330d2245d",
+        cc_get_vote = get_vote_getter(approve=approve_cc)
+        cc_skip = get_skipped_voters(len(governance_data.cc_members)) if cc_skip_votes else set()
+        voter_specs.extend(
+            VoterSpec(
+                role=VoterRoles.CC,
+                vkey_file=m.hot_vkey_file,
+                vote=cc_get_vote(i),
+                idx=i,
             )
             for i, m in enumerate(governance_data.cc_members, start=1)
-        ]
-        votes_cc = [v for v in _votes_cc if v]
+            if i not in cc_skip  # This CC member doesn't vote, his votes count as "No"
+        )
     if approve_drep is not None:
-        _votes_drep = [
-            None  # This DRep doesn't vote, his votes count as "No"
-            if drep_skip_votes and i % 3 == 0
-            else cluster_obj.g_conway_governance.vote.create_drep(
-                vote_name=f"{name_template}_drep{i}",
-                action_txid=action_txid,
-                action_ix=action_ix,
-                vote=get_yes_abstain_vote(i) if approve_drep else get_no_abstain_vote(i),
-                drep_vkey_file=d.key_pair.vkey_file,
-                anchor_url=f"http://www.drep-vote{i}.com",
-                anchor_data_hash="5d372dca1a4cc90d7d16d966c48270e33e3aa0abcb0e78f0d5ca7ff330d2245d",
+        drep_get_vote = get_vote_getter(approve=approve_drep)
+        drep_skip = get_skipped_voters(len(governance_data.dreps_reg)) if drep_skip_votes else set()
+        voter_specs.extend(
+            VoterSpec(
+                role=VoterRoles.DREP,
+                vkey_file=d.key_pair.vkey_file,
+                vote=drep_get_vote(i),
+                idx=i,
             )
             for i, d in enumerate(governance_data.dreps_reg, start=1)
-        ]
-        votes_drep = [v for v in _votes_drep if v]
+            if i not in drep_skip  # This DRep doesn't vote, his votes count as "No"
+        )
     if approve_spo is not None:
-        _votes_spo = [
-            None  # This SPO doesn't vote, his votes count as "No"
-            if spo_skip_votes and i % 3 == 0
-            else cluster_obj.g_conway_governance.vote.create_spo(
-                vote_name=f"{name_template}_pool{i}",
-                action_txid=action_txid,
-                action_ix=action_ix,
-                vote=get_yes_abstain_vote(i) if approve_spo else get_no_abstain_vote(i),
-                cold_vkey_file=p.vkey_file,
-                anchor_url=f"http://www.spo-vote{i}.com",
-                anchor_data_hash="5d372dca1a4cc90d7d16d966c48270e33e3aa0abcb0e78f0d5ca7ff330d2245d",
+        spo_get_vote = get_vote_getter(approve=approve_spo)
+        spo_skip = get_skipped_voters(len(governance_data.pools_cold)) if spo_skip_votes else set()
+        voter_specs.extend(
+            VoterSpec(
+                role=VoterRoles.SPO,
+                vkey_file=p.vkey_file,
+                vote=spo_get_vote(i),
+                idx=i,
             )
             for i, p in enumerate(governance_data.pools_cold, start=1)
-        ]
-        votes_spo = [v for v in _votes_spo if v]
+            if i not in spo_skip  # This SPO doesn't vote, his votes count as "No"
+        )
+
+    votes_created = create_votes_batch(
+        cluster_obj=cluster_obj,
+        name_template=name_template,
+        action_txid=action_txid,
+        action_ix=action_ix,
+        voter_specs=voter_specs,
+    )
+    votes_cc = [v for v in votes_created if isinstance(v, clusterlib.VoteCC)]
+    votes_drep = [v for v in votes_created if isinstance(v, clusterlib.VoteDrep)]
+    votes_spo = [v for v in votes_created if isinstance(v, clusterlib.VoteSPO)]
 
-    cc_keys = [r.hot_skey_file for r in governance_data.cc_members] if votes_cc else []
-    drep_keys = [r.key_pair.skey_file for r in governance_data.dreps_reg] if votes_drep else []
-    spo_keys = [r.skey_file for r in governance_data.pools_cold] if votes_spo else []
+    cc_keys = governance_data.cc_hot_skeys if votes_cc else []
+    drep_keys = governance_data.drep_skeys if votes_drep else []
+    spo_keys = governance_data.spo_skeys if votes_spo else []
 
     votes_all: tp.List[governance_utils.VotesAllT] = [*votes_cc, *votes_drep, *votes_spo]
     keys_all = [*cc_keys, *drep_keys, *spo_keys]
@@ -328,15 +502,21 @@ def resign_ccs(
     payment_addr: clusterlib.AddressRecord,
 ) -> clusterlib.TxRawOutput:
     """Resign multiple CC Members."""
-    res_certs = [
-        cluster_obj.g_conway_governance.committee.gen_cold_key_resignation_cert(
-            key_name=f"{name_template}_{i}",
-            cold_vkey_file=r.cold_vkey_file,
+    gen_cold_key_resignation_cert = (
+        cluster_obj.g_conway_governance.committee.gen_cold_key_resignation_cert
+    )
+
+    key_name_prefix = f"{name_template}_"
+
+    def _gen_res_cert(i: int, cc_member: clusterlib.CCMember) -> pl.Path:
+        return gen_cold_key_resignation_cert(
+            key_name=key_name_prefix + str(i),
+            cold_vkey_file=cc_member.cold_vkey_file,
             resignation_metadata_url=f"http://www.cc-resign{i}.com",
             resignation_metadata_hash="5d372dca1a4cc90d7d16d966c48270e33e3aa0abcb0e78f0d5ca7ff330d2245d",
         )
-        for i, r in enumerate(ccs_to_resign, start=1)
-    ]
+
+    res_certs = _map_in_threads(_gen_res_cert, range(1, len(ccs_to_resign) + 1), ccs_to_resign)
 
     cc_cold_skeys = [r.cold_skey_file for r in ccs_to_resign]
     tx_files = clusterlib.TxFiles(
@@ -352,7 +532,7 @@ def resign_ccs(
         tx_files=tx_files,
     )
 
-    cluster_obj.wait_for_new_block(new_blocks=2)
+    clusterlib_utils.wait_for_new_block(cluster_obj=cluster_obj, new_blocks=2)
     res_committee_state = cluster_obj.g_conway_governance.query.committee_state()
     save_committee_state(committee_state=res_committee_state, name_template=f"{name_template}_res")
     for cc_member in ccs_to_resign:
@@ -418,7 +598,8 @@ def propose_change_constitution(
         == clusterlib.calculate_utxos_balance(tx_output.txins) - tx_output.fee - deposit_amt
     ), f"Incorrect balance for source address `{pool_user.payment.address}`"
 
-    action_txid = cluster_obj.g_transaction.get_txid(tx_body_file=tx_output.out_file)
+    # The txid was already computed when querying the UTxOs created by the Tx
+    action_txid = out_utxos[0].utxo_hash
     action_gov_state = cluster_obj.g_conway_governance.query.gov_state()
     _cur_epoch = cluster_obj.g_query.get_epoch()
     save_gov_state(
@@ -494,7 +675,8 @@ def propose_pparams_update(
         - deposit_amt
     ), f"Incorrect balance for source address `{pool_user.payment.address}`"
 
-    action_txid = cluster_obj.g_transaction.get_txid(tx_body_file=tx_output_action.out_file)
+    # The txid was already computed when querying the UTxOs created by the Tx
+    action_txid = out_utxos_action[0].utxo_hash
     action_gov_state = cluster_obj.g_conway_governance.query.gov_state()
     _cur_epoch = cluster_obj.g_query.get_epoch()
     save_gov_state(gov_state=action_gov_state, name_template=f"{name_template}_action_{_cur_epoch}")
@@ -94,14 +94,13 @@ def get_pool_user(
         )
         fixture_cache.value = pool_users
 
-    # Fund the payment address with some ADA
-    for pool_user in pool_users: 
-        clusterlib_utils.fund_from_faucet(
-            pool_user.payment,
-            cluster_obj=cluster_obj,
-            faucet_data=cluster_manager.cache.addrs_data["user1"],
-            amount=1_500_000,
-        )
+    # Fund the payment addresses with some ADA, all in a single Tx
+    clusterlib_utils.fund_from_faucet(
+        *pool_users,
+        cluster_obj=cluster_obj,
+        faucet_data=cluster_manager.cache.addrs_data["user1"],
+        amount=1_500_000,
+    )
     return pool_users
 
 
@@ -315,7 +314,11 @@ class TestDReps:
             deposit=reg_drep.deposit,
         )
 
-        reg_out_utxos = cluster.g_query.get_utxo(tx_raw_output=tx_output_reg)
+        reg_out_utxos, reg_drep_state = governance_utils.get_utxo_and_drep_state(
+            cluster_obj=cluster,
+            tx_raw_output=tx_output_reg,
+            drep_vkey_file=reg_drep.key_pair.vkey_file,
+        )
         assert (
             clusterlib.filter_utxos(utxos=reg_out_utxos, address=payment_addr.address)[0].amount
             == clusterlib.calculate_utxos_balance(tx_output_reg.txins)
@@ -324,9 +327,6 @@ class TestDReps:
         ), f"Incorrect balance for source address `{payment_addr.address}`"
 
         reqc.cli033.start(url=helpers.get_vcs_link())
-        reg_drep_state = cluster.g_conway_governance.query.drep_state(
-            drep_vkey_file=reg_drep.key_pair.vkey_file
-        )
         assert reg_drep_state[0][0]["keyHash"] == reg_drep.drep_id, "DRep was not registered"
         reqc.cli033.success()
 
@@ -372,13 +372,14 @@ class TestDReps:
         )
 
         reqc.cip024.start(url=helpers.get_vcs_link())
-        ret_drep_state = cluster.g_conway_governance.query.drep_state(
-            drep_vkey_file=reg_drep.key_pair.vkey_file
+        ret_out_utxos, ret_drep_state = governance_utils.get_utxo_and_drep_state(
+            cluster_obj=cluster,
+            tx_raw_output=tx_output_ret,
+            drep_vkey_file=reg_drep.key_pair.vkey_file,
         )
         assert not ret_drep_state, "DRep was not retired"
         reqc.cip024.success()
 
-        ret_out_utxos = cluster.g_query.get_utxo(tx_raw_output=tx_output_ret)
         assert (
             clusterlib.filter_utxos(utxos=ret_out_utxos, address=payment_addr.address)[0].amount
             == clusterlib.calculate_utxos_balance(tx_output_ret.txins)
@@ -538,6 +539,7 @@ class TestDelegDReps:
     @submit_utils.PARAM_SUBMIT_METHOD
     @common.PARAM_USE_BUILD_CMD
     @pytest.mark.parametrize("drep", ("always_abstain", "always_no_confidence", "custom"))
+    @pytest.mark.xdist_group(name="conway_drep_deleg")
     @pytest.mark.testnets
     @pytest.mark.smoke
     def test_dreps_delegation(
@@ -702,11 +704,36 @@ class TestDelegDReps:
             and cluster_nodes.get_cluster_type().type == cluster_nodes.ClusterType.LOCAL
             and "smoke" not in request.config.getoption("-m")
         ):
+            # All the delegations were submitted in a single Tx, so waiting for one epoch
+            # is enough to check all of them.
+            cluster.wait_for_new_epoch(padding_seconds=5)
+            deleg_state = clusterlib_utils.get_delegation_state(cluster_obj=cluster)
+
+            _url = helpers.get_vcs_link()
+            [r.start(url=_url) for r in (reqc.cli034, reqc.cip025)]
+            if drep == "custom":
+                stake_distrib = cluster.g_conway_governance.query.drep_stake_distribution(
+                    drep_key_hash=custom_drep.drep_id
+                )
+                stake_distrib_vkey = cluster.g_conway_governance.query.drep_stake_distribution(
+                    drep_vkey_file=custom_drep.key_pair.vkey_file
+                )
+                assert (
+                    stake_distrib == stake_distrib_vkey
+                ), "DRep stake distribution output mismatch"
+                assert (
+                    len(stake_distrib_vkey) == 1
+                ), "Unexpected number of DRep stake distribution records"
+
+                assert (
+                    stake_distrib_vkey[0][0] == f"drep-keyHash-{custom_drep.drep_id}"
+                ), f"The DRep distribution record doesn't match the DRep ID '{custom_drep.drep_id}'"
+            else:
+                stake_distrib = cluster.g_conway_governance.query.drep_stake_distribution()
+
             for pool_user in pool_users:
-                cluster.wait_for_new_epoch(padding_seconds=5)
-                deleg_state = clusterlib_utils.get_delegation_state(cluster_obj=cluster)
-                stake_addr_hash = cluster.g_stake_address.get_stake_vkey_hash(
-                    stake_vkey_file=pool_user.stake.vkey_file
+                stake_addr_hash = clusterlib_utils.get_stake_vkey_hash(
+                    cluster_obj=cluster, stake_vkey_file=pool_user.stake.vkey_file
                 )
                 reqc.cip020_01.start(url=helpers.get_vcs_link())
                 governance_utils.check_drep_delegation(
@@ -714,35 +741,13 @@ class TestDelegDReps:
                 )
                 reqc.cip020_01.success()
 
-                _url = helpers.get_vcs_link()
-                [r.start(url=_url) for r in (reqc.cli034, reqc.cip025)]
-                if drep == "custom":
-                    stake_distrib = cluster.g_conway_governance.query.drep_stake_distribution(
-                        drep_key_hash=custom_drep.drep_id
-                    )
-                    stake_distrib_vkey = cluster.g_conway_governance.query.drep_stake_distribution(
-                        drep_vkey_file=custom_drep.key_pair.vkey_file
-                    )
-                    assert (
-                        stake_distrib == stake_distrib_vkey
-                    ), "DRep stake distribution output mismatch"
-                    assert (
-                        len(stake_distrib_vkey) == 1
-                    ), "Unexpected number of DRep stake distribution records"
-
-                    assert (
-                        stake_distrib_vkey[0][0] == f"drep-keyHash-{custom_drep.drep_id}"
-                    ), f"The DRep distribution record doesn't match the DRep ID '{custom_drep.drep_id}'"
-                else:
-                    stake_distrib = cluster.g_conway_governance.query.drep_stake_distribution()
-
                 deleg_amount = cluster.g_query.get_address_balance(pool_user.payment.address)
                 governance_utils.check_drep_stake_distribution(
                     distrib_state=stake_distrib,
                     drep_id=drep_id,
                     min_amount=deleg_amount,
                 )
-                [r.success() for r in (reqc.cli034, reqc.cip025)]
+            [r.success() for r in (reqc.cli034, reqc.cip025)]
 
         reqc_deleg.success()
 
@@ -895,11 +900,13 @@ class TestDelegDReps:
             and cluster_nodes.get_cluster_type().type == cluster_nodes.ClusterType.LOCAL
             and "smoke" not in request.config.getoption("-m")
         ):
+            # All the delegations were submitted in a single Tx, so waiting for one epoch
+            # is enough to check all of them.
+            cluster.wait_for_new_epoch(padding_seconds=5)
+            deleg_state = clusterlib_utils.get_delegation_state(cluster_obj=cluster)
             for pool_user_wp in pool_users_wp:
-                cluster.wait_for_new_epoch(padding_seconds=5)
-                deleg_state = clusterlib_utils.get_delegation_state(cluster_obj=cluster)
-                stake_addr_hash = cluster.g_stake_address.get_stake_vkey_hash(
-                    stake_vkey_file=pool_user_wp.stake.vkey_file
+                stake_addr_hash = clusterlib_utils.get_stake_vkey_hash(
+                    cluster_obj=cluster, stake_vkey_file=pool_user_wp.stake.vkey_file
                 )
                 governance_utils.check_drep_delegation(
                     deleg_state=deleg_state, drep_id=drep_id, stake_addr_hash=stake_addr_hash
@@ -1064,8 +1071,8 @@ class TestDRepActivity:
             # Check that stake address is delegated to the correct DRep.
             cluster.wait_for_new_epoch(padding_seconds=5)
             deleg_state = clusterlib_utils.get_delegation_state(cluster_obj=cluster)
-            stake_addr_hash = cluster.g_stake_address.get_stake_vkey_hash(
-                stake_vkey_file=pool_user.stake.vkey_file
+            stake_addr_hash = clusterlib_utils.get_stake_vkey_hash(
+                cluster_obj=cluster, stake_vkey_file=pool_user.stake.vkey_file
             )
             governance_utils.check_drep_delegation(
                 deleg_state=deleg_state,
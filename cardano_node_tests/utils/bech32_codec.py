@@ -0,0 +1,116 @@
+"""In-process bech32 encoding and decoding (BIP-0173).
+
+Unlike BIP-0173, the length of the bech32 string is not limited to 90 characters, as Cardano
+addresses and keys are often longer.
+"""
+
+import typing as tp
+
+CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
+_CHARSET_REV = {c: i for i, c in enumerate(CHARSET)}
+_GENERATORS = (0x3B6A57B2, 0x26508E6D, 0x1EA119FA, 0x3D4233DD, 0x2A1462B3)
+
+
+def bech32_polymod(values: tp.Iterable[int]) -> int:
+    """Compute the bech32 checksum."""
+    chk = 1
+    for value in values:
+        top = chk >> 25
+        chk = (chk & 0x1FFFFFF) << 5 ^ value
+        for i, gen in enumerate(_GENERATORS):
+            if (top >> i) & 1:
+                chk ^= gen
+    return chk
+
+
+def bech32_hrp_expand(hrp: str) -> tp.List[int]:
+    """Expand the human-readable part for checksum computation."""
+    ords = [ord(x) for x in hrp]
+    return [o >> 5 for o in ords] + [0] + [o & 31 for o in ords]
+
+
+def _create_checksum(hrp: str, data: tp.List[int]) -> tp.List[int]:
+    polymod = bech32_polymod([*bech32_hrp_expand(hrp), *data, 0, 0, 0, 0, 0, 0]) ^ 1
+    return [(polymod >> 5 * (5 - i)) & 31 for i in range(6)]
+
+
+def convertbits(
+    data: tp.Iterable[int], frombits: int, tobits: int, pad: bool = True
+) -> tp.List[int]:
+    """Convert a sequence of `frombits`-bit integers to `tobits`-bit integers."""
+    acc = 0
+    bits = 0
+    ret = []
+    maxv = (1 << tobits) - 1
+    max_acc = (1 << (frombits + tobits - 1)) - 1
+    for value in data:
+        if value < 0 or (value >> frombits):
+            msg = f"Invalid value for {frombits}-bit conversion: {value}"
+            raise ValueError(msg)
+        acc = ((acc << frombits) | value) & max_acc
+        bits += frombits
+        while bits >= tobits:
+            bits -= tobits
+            ret.append((acc >> bits) & maxv)
+    if pad:
+        if bits:
+            ret.append((acc << (tobits - bits)) & maxv)
+    elif bits >= frombits or ((acc << (tobits - bits)) & maxv):
+        msg = "Invalid padding in bit conversion"
+        raise ValueError(msg)
+    return ret
+
+
+def bech32_encode(hrp: str, data: tp.List[int]) -> str:
+    """Encode the human-readable part and 5-bit data to a bech32 string."""
+    combined = [*data, *_create_checksum(hrp, data)]
+    return f"{hrp}1{''.join(CHARSET[d] for d in combined)}"
+
+
+def bech32_decode(bech: str) -> tp.Tuple[str, tp.List[int]]:
+    """Decode a bech32 string to the human-readable part and 5-bit data.
+
+    >>> hrp, data = bech32_decode("abcdef1qpzry9x8gf2tvdw0s3jn54khce6mua7lmqqqxw")
+    >>> hrp, data == list(range(32))
+    ('abcdef', True)
+    >>> bech32_decode("abcdef1qpzry9x8gf2tvdw0s3jn54khce6mua7lmqqqxx")
+    Traceback (most recent call last):
+    ...
+    ValueError: Invalid bech32 checksum: abcdef1qpzry9x8gf2tvdw0s3jn54khce6mua7lmqqqxx
+    """
+    if bech.lower() != bech and bech.upper() != bech:
+        msg = f"Mixed case in bech32 string: {bech}"
+        raise ValueError(msg)
+    bech = bech.lower()
+
+    pos = bech.rfind("1")
+    if pos < 1 or pos + 7 > len(bech):
+        msg = f"Invalid bech32 string: {bech}"
+        raise ValueError(msg)
+    if any(ord(x) < 33 or ord(x) > 126 for x in bech):
+        msg = f"Invalid character in bech32 string: {bech}"
+        raise ValueError(msg)
+
+    hrp = bech[:pos]
+    try:
+        data = [_CHARSET_REV[x] for x in bech[pos + 1 :]]
+    except KeyError as exc:
+        msg = f"Invalid character in bech32 data part: {bech}"
+        raise ValueError(msg) from exc
+
+    if bech32_polymod([*bech32_hrp_expand(hrp), *data]) != 1:
+        msg = f"Invalid bech32 checksum: {bech}"
+        raise ValueError(msg)
+
+    return hrp, data[:-6]
+
+
+def decode_to_hex(bech: str) -> str:
+    """Decode a bech32 string to hex-encoded data."""
+    __, data = bech32_decode(bech)
+    return bytes(convertbits(data, 5, 8, pad=False)).hex()
+
+
+def encode_from_hex(hrp: str, data: str) -> str:
+    """Encode hex-encoded data to a bech32 string with the given human-readable part."""
+    return bech32_encode(hrp, convertbits(bytes.fromhex(data), 8, 5))
@@ -2,6 +2,7 @@
 
 import base64
 import dataclasses
+import functools
 import itertools
 import json
 import logging
@@ -15,6 +16,7 @@ import cbor2
 from cardano_clusterlib import clusterlib
 from cardano_clusterlib import txtools as cl_txtools
 
+from cardano_node_tests.utils import configuration
 from cardano_node_tests.utils import helpers
 from cardano_node_tests.utils import locking
 from cardano_node_tests.utils import submit_utils
@@ -1107,6 +1109,57 @@ def wait_for_epoch_interval(
         raise AssertionError(msg)
 
 
+def wait_for_new_block(
+    cluster_obj: clusterlib.ClusterLib,
+    new_blocks: int = 1,
+    poll_interval_ms: tp.Optional[int] = None,
+) -> int:
+    """Wait for new block(s) to be created, polling the ledger tip in short intervals.
+
+    Unlike `clusterlib.ClusterLib.wait_for_new_block`, the polling interval doesn't grow,
+    so the new blocks are noticed soon after they are added to the ledger.
+
+    Args:
+        cluster_obj: An instance of `clusterlib.ClusterLib`.
+        new_blocks: A number of new blocks to wait for (optional).
+        poll_interval_ms: An interval for polling the tip, in milliseconds (optional,
+            `configuration.TIP_POLL_INTERVAL_MS` by default).
+
+    Returns:
+        int: A block number of last added block.
+    """
+    initial_block = int(cluster_obj.g_query.get_tip()["block"])
+    if new_blocks < 1:
+        return initial_block
+
+    block_no = initial_block + new_blocks
+    poll_interval_sec = (poll_interval_ms or configuration.TIP_POLL_INTERVAL_MS) / 1000
+    # Reset the timeout every time a new block is created
+    next_block_timeout = 300 * cluster_obj.slot_length
+
+    LOGGER.debug(f"Waiting for {new_blocks} new block(s) to be created.")
+
+    # New blocks cannot be created faster than one per slot
+    time.sleep(cluster_obj.slot_length * new_blocks)
+
+    this_block = initial_block
+    timeout_at = time.monotonic() + next_block_timeout
+    while True:
+        prev_block = this_block
+        this_block = int(cluster_obj.g_query.get_tip()["block"])
+        if this_block >= block_no:
+            break
+        if this_block > prev_block:
+            timeout_at = time.monotonic() + next_block_timeout
+        elif time.monotonic() > timeout_at:
+            msg = f"Timeout waiting for {new_blocks} new block(s)."
+            raise clusterlib.CLIError(msg)
+        time.sleep(poll_interval_sec)
+
+    LOGGER.debug(f"New block(s) were created; block number: {this_block}")
+    return this_block
+
+
 def load_body_metadata(tx_body_file: pl.Path) -> tp.Any:
     """Load metadata from file containing transaction body."""
     with open(tx_body_file, encoding="utf-8") as body_fp:
@@ -1225,6 +1278,31 @@ def cli_has(command: str) -> bool:
     return helpers.tool_has(full_command)
 
 
+@functools.lru_cache(maxsize=1024)
+def _get_stake_vkey_hash(
+    cluster_obj: clusterlib.ClusterLib,
+    stake_vkey_file: str,
+    mtime_ns: int,  # noqa: ARG001 # invalidates the cache when the file changes
+) -> str:
+    return cluster_obj.g_stake_address.get_stake_vkey_hash(stake_vkey_file=stake_vkey_file)
+
+
+def get_stake_vkey_hash(
+    cluster_obj: clusterlib.ClusterLib, stake_vkey_file: cl_types.FileType
+) -> str:
+    """Return the hash of a stake verification key, cached per key file.
+
+    The hash is a pure function of the key file, so the `cardano-cli` call is done only once
+    for a file that is reused across tests (e.g. cached pool users).
+    """
+    vkey_path = pl.Path(stake_vkey_file).absolute()
+    return _get_stake_vkey_hash(
+        cluster_obj=cluster_obj,
+        stake_vkey_file=str(vkey_path),
+        mtime_ns=vkey_path.stat().st_mtime_ns,
+    )
+
+
 def check_txins_spent(
     cluster_obj: clusterlib.ClusterLib, txins: tp.List[clusterlib.UTXOData], wait_blocks: int = 2
 ) -> None:
@@ -109,6 +109,15 @@ else:
 
 DONT_OVERWRITE_OUTFILES = bool(os.environ.get("DONT_OVERWRITE_OUTFILES"))
 
+# format of the ledger states saved for debugging purposes
+STATE_DUMP_FORMAT = os.environ.get("STATE_DUMP_FORMAT") or "json"
+if STATE_DUMP_FORMAT not in ("json", "cbor"):
+    msg = f"Invalid STATE_DUMP_FORMAT: {STATE_DUMP_FORMAT}"
+    raise RuntimeError(msg)
+
+# interval for polling the ledger tip when waiting for new blocks
+TIP_POLL_INTERVAL_MS = int(os.environ.get("TIP_POLL_INTERVAL_MS") or 150)
+
 # cluster instances are kept running after tests finish
 KEEP_CLUSTERS_RUNNING = bool(os.environ.get("KEEP_CLUSTERS_RUNNING"))
 
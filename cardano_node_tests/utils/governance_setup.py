@@ -1,4 +1,5 @@
 import dataclasses
+import functools
 import logging
 import pathlib as pl
 import pickle
@@ -32,6 +33,21 @@ class DefaultGovernance:
     cc_members: tp.List[clusterlib.CCMember]
     pools_cold: tp.List[clusterlib.ColdKeyPair]
 
+    @functools.cached_property
+    def cc_hot_skeys(self) -> tp.List[clusterlib.FileType]:
+        """Hot signing keys of all CC members."""
+        return [r.hot_skey_file for r in self.cc_members]
+
+    @functools.cached_property
+    def drep_skeys(self) -> tp.List[pl.Path]:
+        """Signing keys of all DReps."""
+        return [r.key_pair.skey_file for r in self.dreps_reg]
+
+    @functools.cached_property
+    def spo_skeys(self) -> tp.List[pl.Path]:
+        """Cold signing keys of all SPOs."""
+        return [r.skey_file for r in self.pools_cold]
+
 
 GovClusterT = tp.Tuple[clusterlib.ClusterLib, DefaultGovernance]
 
@@ -77,8 +93,8 @@ def _cast_vote(
         ],
         signing_key_files=[
             payment_addr.skey_file,
-            *[r.skey_file for r in governance_data.pools_cold],
-            *[r.key_pair.skey_file for r in governance_data.dreps_reg],
+            *governance_data.spo_skeys,
+            *governance_data.drep_skeys,
         ],
     )
 
@@ -1,5 +1,6 @@
 """Utilities for Conway governance."""
 
+import concurrent.futures
 import dataclasses
 import enum
 import functools
@@ -89,14 +90,14 @@ class ActionTags(enum.Enum):
     HARDFORK_INIT = "HardForkInitiation"
 
 
-def get_drep_cred_name(drep_id: str) -> str:
-    cred_name = f"keyHash-{drep_id}"
-    if drep_id == "always_abstain":
-        cred_name = "alwaysAbstain"
-    elif drep_id == "always_no_confidence":
-        cred_name = "alwaysNoConfidence"
+_SPECIAL_DREP_CRED_NAMES = {
+    "always_abstain": "alwaysAbstain",
+    "always_no_confidence": "alwaysNoConfidence",
+}
+
 
-    return cred_name
+def get_drep_cred_name(drep_id: str) -> str:
+    return _SPECIAL_DREP_CRED_NAMES.get(drep_id) or f"keyHash-{drep_id}"
 
 
 def get_vote_str(vote: clusterlib.Votes) -> str:
@@ -112,12 +113,8 @@ def get_vote_str(vote: clusterlib.Votes) -> str:
 
 def check_drep_delegation(deleg_state: dict, drep_id: str, stake_addr_hash: str) -> None:
     drep_records = deleg_state["dstate"]["unified"]["credentials"]
-
-    stake_addr_key = f"keyHash-{stake_addr_hash}"
-    stake_addr_val = drep_records.get(stake_addr_key) or {}
-
-    cred_name = get_drep_cred_name(drep_id=drep_id)
-    expected_drep = f"drep-{cred_name}"
+    stake_addr_val = drep_records.get(f"keyHash-{stake_addr_hash}") or {}
+    expected_drep = f"drep-{get_drep_cred_name(drep_id=drep_id)}"
 
     assert stake_addr_val.get("drep") == expected_drep
 
@@ -231,6 +228,23 @@ def get_drep_reg_record(
     )
 
 
+def get_utxo_and_drep_state(
+    cluster_obj: clusterlib.ClusterLib,
+    tx_raw_output: clusterlib.TxRawOutput,
+    drep_vkey_file: clusterlib.FileType,
+) -> tp.Tuple[tp.List[clusterlib.UTXOData], DRepStateT]:
+    """Get UTxOs created by a Tx and state of a DRep.
+
+    The two queries are independent, so they run concurrently.
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        utxo_future = executor.submit(cluster_obj.g_query.get_utxo, tx_raw_output=tx_raw_output)
+        drep_state_future = executor.submit(
+            cluster_obj.g_conway_governance.query.drep_state, drep_vkey_file=drep_vkey_file
+        )
+        return utxo_future.result(), drep_state_future.result()
+
+
 def get_cc_member_auth_record(
     cluster_obj: clusterlib.ClusterLib,
     name_template: str,
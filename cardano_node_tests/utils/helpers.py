@@ -1,24 +1,27 @@
 import argparse
 import collections
 import contextlib
-import datetime
 import functools
 import hashlib
 import inspect
-import io
 import itertools
 import json
 import logging
 import os
 import pathlib as pl
 import random
+import shlex
+import shutil
 import signal
 import string
 import subprocess
+import threading
+import time
 import types as tt
 import typing as tp
 
 import cardano_node_tests.utils.types as ttypes
+from cardano_node_tests.utils import bech32_codec
 
 LOGGER = logging.getLogger(__name__)
 
@@ -35,16 +38,20 @@ def callonce(func: TCallable) -> TCallable:
        Therefore, this decorator should be used only for functions without arguments
        or for functions with constant arguments.
     """
-    result: list = []
+    missing = object()
+    result: tp.Any = missing
+    lock = threading.Lock()
 
     @functools.wraps(func)
     def wrapper(*args, **kwargs):  # type: ignore
-        if result:
-            return result[0]
+        nonlocal result
+        if result is not missing:
+            return result
 
-        retval = func(*args, **kwargs)
-        result.append(retval)
-        return retval
+        with lock:
+            if result is missing:
+                result = func(*args, **kwargs)
+        return result
 
     return tp.cast(TCallable, wrapper)
 
@@ -54,12 +61,12 @@ def change_cwd(dir_path: ttypes.FileType) -> tp.Iterator[ttypes.FileType]:
     """Change and restore CWD - context manager."""
     orig_cwd = pl.Path.cwd()
     os.chdir(dir_path)
-    LOGGER.debug(f"Changed CWD to '{dir_path}'.")
+    LOGGER.debug("Changed CWD to '%s'.", dir_path)
     try:
         yield dir_path
     finally:
         os.chdir(orig_cwd)
-        LOGGER.debug(f"Restored CWD to '{orig_cwd}'.")
+        LOGGER.debug("Restored CWD to '%s'.", orig_cwd)
 
 
 @contextlib.contextmanager
@@ -92,8 +99,9 @@ def environ(env: dict) -> tp.Iterator[None]:
     finally:
         for key, value in original_env.items():
             if value is None:
-                del os.environ[key]
-            else:
+                # The variable may have been already removed inside the context
+                os.environ.pop(key, None)
+            elif os.environ.get(key) != value:
                 os.environ[key] = value
 
 
@@ -106,7 +114,12 @@ def run_command(
     """Run command."""
     cmd: tp.Union[str, list]
     if isinstance(command, str):
-        cmd = command if shell else command.split()
+        if shell:
+            cmd = command
+        elif "'" in command or '"' in command:
+            cmd = shlex.split(command)
+        else:
+            cmd = command.split()
         cmd_str = command
     else:
         cmd = command
@@ -114,13 +127,14 @@ def run_command(
 
     LOGGER.debug("Running `%s`", cmd_str)
 
-    # pylint: disable=consider-using-with
-    if workdir:
-        with change_cwd(workdir):
-            p = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, shell=shell)
-    else:
-        p = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, shell=shell)
-    stdout, stderr = p.communicate()
+    p = subprocess.run(
+        cmd,
+        capture_output=True,
+        shell=shell,
+        cwd=workdir or None,
+        check=False,
+    )
+    stdout, stderr = p.stdout, p.stderr
 
     if not ignore_fail and p.returncode != 0:
         err_dec = stderr.decode()
@@ -148,7 +162,7 @@ def get_rand_str(length: int = 8) -> str:
     """Return random string."""
     if length < 1:
         return ""
-    return "".join(random.choice(string.ascii_lowercase) for i in range(length))
+    return "".join(random.choices(string.ascii_lowercase, k=length))
 
 
 # TODO: unify with the implementation in clusterlib
@@ -165,7 +179,10 @@ def prepend_flag(flag: str, contents: tp.Iterable) -> tp.List[str]:
     >>> prepend_flag("--foo", [1, 2, 3])
     ['--foo', '1', '--foo', '2', '--foo', '3']
     """
-    return list(itertools.chain.from_iterable([flag, str(x)] for x in contents))
+    items = [str(x) for x in contents]
+    out = [flag] * (2 * len(items))
+    out[1::2] = items
+    return out
 
 
 def get_timestamped_rand_str(rand_str_length: int = 4) -> str:
@@ -174,7 +191,13 @@ def get_timestamped_rand_str(rand_str_length: int = 4) -> str:
     >>> len(get_timestamped_rand_str()) == len("200801_002401314_cinf")
     True
     """
-    timestamp = datetime.datetime.now(tz=datetime.timezone.utc).strftime("%y%m%d_%H%M%S%f")[:-3]
+    now_ns = time.time_ns()
+    now_ms = (now_ns // 1_000_000) % 1000
+    tm = time.gmtime(now_ns // 1_000_000_000)
+    timestamp = (
+        f"{tm.tm_year % 100:02d}{tm.tm_mon:02d}{tm.tm_mday:02d}_"
+        f"{tm.tm_hour:02d}{tm.tm_min:02d}{tm.tm_sec:02d}{now_ms:03d}"
+    )
     rand_str_component = get_rand_str(rand_str_length)
     rand_str_component = rand_str_component and f"_{rand_str_component}"
     return f"{timestamp}{rand_str_component}"
@@ -197,40 +220,81 @@ def get_current_line_str() -> str:
     return get_line_str_from_frame(frame=calling_frame)
 
 
+@functools.lru_cache(maxsize=4096)
+def _get_vcs_link_for_line(fpath: str, lineno: int) -> str:
+    __, sep, tail = fpath.partition("cardano_node_tests")
+    loc_part = f"{sep}{tail}#L{lineno}" if sep else f"{fpath}#L{lineno}"
+    url = f"{GITHUB_URL}/blob/{get_current_commit()}/{loc_part}"
+    return url
+
+
 def get_vcs_link() -> str:
     """Return link to the current line in GitHub."""
     calling_frame = inspect.currentframe().f_back  # type: ignore
     assert calling_frame
-    line_str = get_line_str_from_frame(frame=calling_frame)
-    loc_part = line_str[line_str.find("cardano_node_tests") :]
-    url = f"{GITHUB_URL}/blob/{get_current_commit()}/{loc_part}"
-    return url
+    return _get_vcs_link_for_line(
+        fpath=calling_frame.f_globals["__file__"], lineno=calling_frame.f_lineno
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _checksum(
+    filename: str,
+    mtime_ns: int,  # noqa: ARG001 # invalidates the cache when the file changes
+    size: int,  # noqa: ARG001 # invalidates the cache when the file changes
+    blocksize: int,
+) -> str:
+    with open(filename, "rb", buffering=0) as f:
+        # `hashlib.file_digest` is available in Python >= 3.11
+        file_digest = getattr(hashlib, "file_digest", None)
+        if file_digest:
+            return str(file_digest(f, "blake2b").hexdigest())
+
+        hash_o = hashlib.blake2b()
+        buf = bytearray(blocksize)
+        view = memoryview(buf)
+        while nread := f.readinto(buf):
+            hash_o.update(view[:nread])
+    return hash_o.hexdigest()
 
 
-def checksum(filename: ttypes.FileType, blocksize: int = 65536) -> str:
-    """Return file checksum."""
-    hash_o = hashlib.blake2b()
-    with open(filename, "rb") as f:
-        for block in iter(lambda: f.read(blocksize), b""):
-            hash_o.update(block)
-    return hash_o.hexdigest()
+def checksum(filename: ttypes.FileType, blocksize: int = 1 << 20) -> str:
+    """Return file checksum.
+
+    The checksum is cached until the file modification time or size changes.
+    """
+    abs_path = pl.Path(filename).absolute()
+    stat = abs_path.stat()
+    return _checksum(
+        filename=str(abs_path), mtime_ns=stat.st_mtime_ns, size=stat.st_size, blocksize=blocksize
+    )
 
 
-def write_json(out_file: ttypes.FileType, content: dict) -> ttypes.FileType:
-    """Write dictionary content to JSON file."""
+def write_json(out_file: ttypes.FileType, content: tp.Any, indent: int = 4) -> ttypes.FileType:
+    """Write content to JSON file."""
     with open(pl.Path(out_file).expanduser(), "w", encoding="utf-8") as out_fp:
-        out_fp.write(json.dumps(content, indent=4))
+        json.dump(content, out_fp, indent=indent)
     return out_file
 
 
 def decode_bech32(bech32: str) -> str:
-    """Convert from bech32 string."""
-    return run_command(f"echo '{bech32}' | bech32", shell=True).decode().strip()
+    """Convert from bech32 string.
+
+    >>> addr = (
+    ...     "addr_test1qz2fxv2umyhttkxyxp8x0dlpdt3k6cwng5pxj3jhsydzer3n0d3vllmyqwsx5wk"
+    ...     "tcd8cc3sq835lu7drv2xwl2wywfgs68faae"
+    ... )
+    >>> decode_bech32(addr)[:58]
+    '009493315cd92eb5d8c4304e67b7e16ae36d61d34502694657811a2c8e'
+    >>> encode_bech32(prefix="addr_test", data=decode_bech32(addr)) == addr
+    True
+    """
+    return bech32_codec.decode_to_hex(bech32.strip())
 
 
 def encode_bech32(prefix: str, data: str) -> str:
     """Convert to bech32 string."""
-    return run_command(f"echo '{data}' | bech32 {prefix}", shell=True).decode().strip()
+    return bech32_codec.encode_from_hex(hrp=prefix, data=data.strip())
 
 
 def check_dir_arg(dir_path: str) -> tp.Optional[pl.Path]:
@@ -257,10 +321,7 @@ def check_file_arg(file_path: str) -> tp.Optional[pl.Path]:
 
 def get_eof_offset(infile: pl.Path) -> int:
     """Return position of the current end of the file."""
-    with open(infile, "rb") as in_fp:
-        in_fp.seek(0, io.SEEK_END)
-        last_line_pos = in_fp.tell()
-    return last_line_pos
+    return pl.Path(infile).stat().st_size
 
 
 def is_in_interval(num1: float, num2: float, frac: float = 0.1) -> bool:
@@ -271,12 +332,21 @@ def is_in_interval(num1: float, num2: float, frac: float = 0.1) -> bool:
     return _min <= num1 <= _max
 
 
-@functools.lru_cache(maxsize=100)
+@functools.cache
+def _is_executable_available(executable: str) -> bool:
+    return shutil.which(executable) is not None
+
+
+@functools.cache
 def tool_has(command: str) -> bool:
     """Check if a tool has a subcommand or argument available.
 
     E.g. `tool_has_arg("create-script-context --plutus-v1")`
     """
+    executable = command.split(maxsplit=1)[0] if command else ""
+    if not (executable and _is_executable_available(executable)):
+        return False
+
     err_str = ""
     try:
         run_command(command)